@@ -41,18 +41,29 @@ class Client:
     Attributes:
         transport: A transport object which is used for communication with the EPP server.
         schema: A XML schema used to validate Responses. No validation is done if schema is None.
+        validate_responses: Whether to validate Responses by the schema.
         greeting: The last Greeting received from the EPP server. None if no Greeting was received yet.
     """
 
-    def __init__(self, transport: Transport, schema: Optional[XMLSchema] = None):
+    def __init__(
+        self,
+        transport: Transport,
+        schema: Optional[XMLSchema] = None,
+        *,
+        validate_responses: bool = True
+    ):
         """Init the Client.
 
         Args:
             transport: A transport object which is used for communication with the EPP server.
             schema: A XML schema used to validate Responses. No validation is done if schema is None.
+            validate_responses: Whether to validate Responses by the schema. Validation of the Responses may be
+                disabled to save the time spent on it if the EPP server is trusted, while the Requests are still
+                validated.
         """
         self.transport = transport
         self.schema = schema
+        self.validate_responses = validate_responses
         self.greeting: Optional[Greeting] = None
 
     def __enter__(self) -> "Client":
@@ -105,7 +116,8 @@ class Client:
         """
         response_raw = self.transport.receive()
         self._log_raw_xml(response_raw)
-        response_parsed = response_class.parse(response_raw, self.schema)
+        schema = self.schema if self.validate_responses else None
+        response_parsed = response_class.parse(response_raw, schema)
 
         if isinstance(response_parsed, Greeting):
             self.greeting = response_parsed
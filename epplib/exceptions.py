@@ -18,7 +18,7 @@
 
 """Module definig exceptions used in the epplib."""
 
-from typing import Any
+from typing import Any, Optional
 
 
 class EpplibException(Exception):
@@ -26,17 +26,41 @@ class EpplibException(Exception):
 
 
 class ParsingError(EpplibException):
-    """Error to indicate a failure while parsing of the EPP response."""
+    """Error to indicate a failure while parsing of the EPP response.
+
+    Attributes:
+        raw_response: The raw data received from the server.
+        RAW_RESPONSE_MAX_LENGTH: Maximal length of the raw response included in the error message. The complete raw
+            response is always available in the raw_response attribute.
+    """
+
+    RAW_RESPONSE_MAX_LENGTH = 4096
 
     def __init__(self, *args: Any, raw_response: Any = None):
         self.raw_response = raw_response
+        self._appendix: Optional[str] = None
         super().__init__(*args)
 
     def __str__(self) -> str:
         if self.raw_response is None:
             appendix = ""
         else:
-            appendix = "Raw response:\n{!r}".format(self.raw_response)
+            # The raw response may be large, so its representation is made only once.
+            if self._appendix is None:
+                raw_response = self.raw_response
+                # Only the raw data can be truncated, other values are represented as they are.
+                if (
+                    isinstance(raw_response, (bytes, str))
+                    and len(raw_response) > self.RAW_RESPONSE_MAX_LENGTH
+                ):
+                    raw_response = raw_response[: self.RAW_RESPONSE_MAX_LENGTH]
+                    suffix = "\n... ({} more)".format(
+                        len(self.raw_response) - self.RAW_RESPONSE_MAX_LENGTH
+                    )
+                else:
+                    suffix = ""
+                self._appendix = "Raw response:\n{!r}{}".format(raw_response, suffix)
+            appendix = self._appendix
         return super().__str__() + appendix
 
 
@@ -19,15 +19,57 @@
 """Module providing models to EPP check responses."""
 
 from dataclasses import dataclass
-from typing import Optional
+from sys import intern
+from typing import TYPE_CHECKING, ClassVar, Optional, Type, TypeVar
 
 from lxml.etree import Element
 
 from epplib.models import ExtractModelMixin
+from epplib.utils import DATACLASS_SLOTS
 
+CheckResultDataT = TypeVar("CheckResultDataT", bound="CheckResultData")
 
-@dataclass
-class CheckDomainResultData(ExtractModelMixin):
+
+class CheckResultData(ExtractModelMixin):
+    """Base class for the items of the check results.
+
+    All the check results share the same structure, they differ only in the namespace and the name of the
+    identifier element. Subclasses just define the paths.
+
+    Attributes:
+        _id_path: Path to the element with the identifier of the object.
+        _reason_path: Path to the element with the reason of the unavailability.
+    """
+
+    __slots__ = ()
+
+    _id_path: ClassVar[str]
+    _reason_path: ClassVar[str]
+
+    if TYPE_CHECKING:
+        # The subclasses are dataclasses, which name the identifier differently. We need to specify init for typing,
+        # the dataclasses generate their own at runtime.
+        def __init__(self, id: Optional[str], avail: Optional[bool], reason: Optional[str] = None) -> None:
+            pass  # pragma: no cover
+
+    @classmethod
+    def extract(cls: Type[CheckResultDataT], element: Element) -> CheckResultDataT:
+        """Extract params for own init from the element."""
+        id_element = cls._find(element, cls._id_path)
+        if id_element is None:
+            id_text, avail = None, None
+        else:
+            id_text = id_element.text or ""
+            avail = cls._str_to_bool(id_element.get("avail"))
+        reason = cls._find_text(element, cls._reason_path)
+        # Reasons come from a small set of server messages, so they are interned.
+        if reason is not None:
+            reason = intern(reason)
+        return cls(id_text, avail, reason)
+
+
+@dataclass(**DATACLASS_SLOTS)
+class CheckDomainResultData(CheckResultData):
     """Dataclass representing domain availability in the check domain result.
 
     Attributes:
@@ -40,19 +82,12 @@ class CheckDomainResultData(ExtractModelMixin):
     avail: Optional[bool]
     reason: Optional[str] = None
 
-    @classmethod
-    def extract(cls, element: Element) -> "CheckDomainResultData":
-        """Extract params for own init from the element."""
-        params = (
-            cls._find_text(element, "./domain:name"),
-            cls._str_to_bool(cls._find_attrib(element, "./domain:name", "avail")),
-            cls._find_text(element, "./domain:reason"),
-        )
-        return cls(*params)
+    _id_path = "./domain:name"
+    _reason_path = "./domain:reason"
 
 
-@dataclass
-class CheckContactResultData(ExtractModelMixin):
+@dataclass(**DATACLASS_SLOTS)
+class CheckContactResultData(CheckResultData):
     """Dataclass representing contact availability in the check contact result.
 
     Attributes:
@@ -65,19 +100,12 @@ class CheckContactResultData(ExtractModelMixin):
     avail: Optional[bool]
     reason: Optional[str] = None
 
-    @classmethod
-    def extract(cls, element: Element) -> "CheckContactResultData":
-        """Extract params for own init from the element."""
-        params = (
-            cls._find_text(element, "./contact:id"),
-            cls._str_to_bool(cls._find_attrib(element, "./contact:id", "avail")),
-            cls._find_text(element, "./contact:reason"),
-        )
-        return cls(*params)
+    _id_path = "./contact:id"
+    _reason_path = "./contact:reason"
 
 
-@dataclass
-class CheckHostResultData(ExtractModelMixin):
+@dataclass(**DATACLASS_SLOTS)
+class CheckHostResultData(CheckResultData):
     """Dataclass representing host availability in the check host result.
 
     Attributes:
@@ -90,19 +118,12 @@ class CheckHostResultData(ExtractModelMixin):
     avail: Optional[bool]
     reason: Optional[str] = None
 
-    @classmethod
-    def extract(cls, element: Element) -> "CheckHostResultData":
-        """Extract params for own init from the element."""
-        params = (
-            cls._find_text(element, "./host:name"),
-            cls._str_to_bool(cls._find_attrib(element, "./host:name", "avail")),
-            cls._find_text(element, "./host:reason"),
-        )
-        return cls(*params)
+    _id_path = "./host:name"
+    _reason_path = "./host:reason"
 
 
-@dataclass
-class CheckNssetResultData(ExtractModelMixin):
+@dataclass(**DATACLASS_SLOTS)
+class CheckNssetResultData(CheckResultData):
     """Dataclass representing nsset availability in the check nsset result.
 
     Attributes:
@@ -115,19 +136,12 @@ class CheckNssetResultData(ExtractModelMixin):
     avail: Optional[bool]
     reason: Optional[str] = None
 
-    @classmethod
-    def extract(cls, element: Element) -> "CheckNssetResultData":
-        """Extract params for own init from the element."""
-        params = (
-            cls._find_text(element, "./nsset:id"),
-            cls._str_to_bool(cls._find_attrib(element, "./nsset:id", "avail")),
-            cls._find_text(element, "./nsset:reason"),
-        )
-        return cls(*params)
+    _id_path = "./nsset:id"
+    _reason_path = "./nsset:reason"
 
 
-@dataclass
-class CheckKeysetResultData(ExtractModelMixin):
+@dataclass(**DATACLASS_SLOTS)
+class CheckKeysetResultData(CheckResultData):
     """Dataclass representing keyset availability in the check keyset result.
 
     Attributes:
@@ -140,12 +154,5 @@ class CheckKeysetResultData(ExtractModelMixin):
     avail: Optional[bool]
     reason: Optional[str] = None
 
-    @classmethod
-    def extract(cls, element: Element) -> "CheckKeysetResultData":
-        """Extract params for own init from the element."""
-        params = (
-            cls._find_text(element, "./keyset:id"),
-            cls._str_to_bool(cls._find_attrib(element, "./keyset:id", "avail")),
-            cls._find_text(element, "./keyset:reason"),
-        )
-        return cls(*params)
+    _id_path = "./keyset:id"
+    _reason_path = "./keyset:reason"
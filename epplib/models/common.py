@@ -25,7 +25,7 @@ from typing import ClassVar, List, Mapping, Optional, Sequence, Set, Union, cast
 from lxml.etree import Element, QName, SubElement
 
 from epplib.constants import NAMESPACE
-from epplib.utils import ParseXMLMixin
+from epplib.utils import DATACLASS_SLOTS, ParseXMLMixin
 
 
 @unique
@@ -64,6 +64,8 @@ class Unit(str, Enum):
 class ExtractModelMixin(ParseXMLMixin, ABC):
     """Mixin for model which are deserializable from XML."""
 
+    __slots__ = ()
+
     @classmethod
     @abstractmethod
     def extract(cls, element: Element) -> "ExtractModelMixin":
@@ -147,7 +149,7 @@ class AuthInfo(PayloadModelMixin, ExtractModelMixin):
     @classmethod
     def extract(cls, element: Element) -> Union[str, "AuthInfo"]:
         """Extract the model from the element."""
-        pw = cls._find_text(element, "./{*}pw")
+        pw = cls._find_text(element, "./*[local-name()='pw']")
         if pw is None:
             return element.text
         return cls(pw=pw)
@@ -610,7 +612,7 @@ class PostalInfo(PayloadModelMixin, ExtractModelMixin):
         return cls(name=name, addr=addr, org=org)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Statement(ExtractModelMixin):
     """A dataclass to represent the EPP statement.
 
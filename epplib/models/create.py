@@ -19,12 +19,12 @@
 """Module providing models for EPP create responses."""
 from dataclasses import MISSING, dataclass
 from datetime import date, datetime
-from typing import ClassVar, Optional
+from typing import ClassVar, Dict, Optional, cast
 
-from dateutil.parser import parse as parse_datetime
 from lxml.etree import Element
 
 from epplib.models import ContactAddr, ExtractModelMixin, PostalInfo
+from epplib.utils import DATACLASS_SLOTS
 
 
 @dataclass
@@ -37,7 +37,7 @@ class CreatePostalInfo(PostalInfo):
     addr: ContactAddr = MISSING  # type: ignore[assignment]
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CreateDomainResultData(ExtractModelMixin):
     """Dataclass representing result of domain creation.
 
@@ -54,15 +54,23 @@ class CreateDomainResultData(ExtractModelMixin):
     @classmethod
     def extract(cls, element: Element) -> "CreateDomainResultData":
         """Extract params for own init from the element."""
+        # Collect all the values in a single query, the first occurrence of each element wins.
+        # Dispatch on the local name, the namespace is given by the domain prefix in _NAMESPACES.
+        texts: Dict[str, str] = {}
+        for child in cls._find_all(
+            element, "./domain:name|./domain:crDate|./domain:exDate"
+        ):
+            texts.setdefault(child.tag.rpartition("}")[2], child.text or "")
+        ex_date = texts.get("exDate")
         params = (
-            cls._find_text(element, "./domain:name"),
-            parse_datetime(cls._find_text(element, "./domain:crDate")),
-            cls._optional(cls._parse_date, cls._find_text(element, "./domain:exDate")),
+            cast(str, texts.get("name")),
+            cls._parse_datetime(cast(str, texts.get("crDate"))),
+            None if ex_date is None else cls._parse_date(ex_date),
         )
         return cls(*params)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CreateHostResultData(ExtractModelMixin):
     """Dataclass representing result of host creation.
 
@@ -81,14 +89,14 @@ class CreateHostResultData(ExtractModelMixin):
         """Extract params for own init from the element."""
         params = (
             cls._find_text(element, "./{}:name".format(cls._namespace_prefix)),
-            parse_datetime(
+            cls._parse_datetime(
                 cls._find_text(element, "./{}:crDate".format(cls._namespace_prefix))
             ),
         )
         return cls(*params)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CreateNonDomainResultData(ExtractModelMixin):
     """Dataclass representing result of creation of object other than domain.
 
@@ -107,14 +115,14 @@ class CreateNonDomainResultData(ExtractModelMixin):
         """Extract params for own init from the element."""
         params = (
             cls._find_text(element, "./{}:id".format(cls._namespace_prefix)),
-            parse_datetime(
+            cls._parse_datetime(
                 cls._find_text(element, "./{}:crDate".format(cls._namespace_prefix))
             ),
         )
         return cls(*params)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CreateContactResultData(CreateNonDomainResultData):
     """Dataclass representing result of contact creation.
 
@@ -126,7 +134,7 @@ class CreateContactResultData(CreateNonDomainResultData):
     _namespace_prefix: ClassVar[Optional[str]] = "contact"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CreateNssetResultData(CreateNonDomainResultData):
     """Dataclass representing result of nsset creation.
 
@@ -138,7 +146,7 @@ class CreateNssetResultData(CreateNonDomainResultData):
     _namespace_prefix: ClassVar[Optional[str]] = "nsset"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CreateKeysetResultData(CreateNonDomainResultData):
     """Dataclass representing result of keyset creation.
 
@@ -24,9 +24,10 @@ from decimal import Decimal
 from lxml.etree import Element
 
 from epplib.models import ExtractModelMixin
+from epplib.utils import DATACLASS_SLOTS
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CreditInfoResultData(ExtractModelMixin):
     """Dataclass representing zone credit in the credit info result.
 
@@ -20,9 +20,8 @@
 
 from dataclasses import dataclass, field, InitVar
 from datetime import date, datetime
-from typing import Any, ClassVar, List, Mapping, Optional, Sequence, Union
+from typing import Any, ClassVar, Dict, List, Optional, Sequence, Union
 
-from dateutil.parser import parse as parse_datetime
 from lxml.etree import Element
 
 from epplib.models import (
@@ -72,8 +71,11 @@ class InfoResultData(ExtractModelMixin):
         return cls(**cls._get_params(element))
 
     @classmethod
-    def _get_params(cls, element: Element) -> Mapping[str, Any]:
-        params: Mapping[str, Any] = {
+    def _get_params(cls, element: Element) -> Dict[str, Any]:
+        cr_date = cls._find_text(element, f"./{cls._namespace}:crDate")
+        up_date = cls._find_text(element, f"./{cls._namespace}:upDate")
+        tr_date = cls._find_text(element, f"./{cls._namespace}:trDate")
+        params: Dict[str, Any] = {
             "roid": cls._find_text(element, f"./{cls._namespace}:roid"),
             "statuses": [
                 Status.extract(item)
@@ -81,16 +83,10 @@ class InfoResultData(ExtractModelMixin):
             ],
             "cl_id": cls._find_text(element, f"./{cls._namespace}:clID"),
             "cr_id": cls._find_text(element, f"./{cls._namespace}:crID"),
-            "cr_date": cls._optional(
-                parse_datetime, cls._find_text(element, f"./{cls._namespace}:crDate")
-            ),
+            "cr_date": None if cr_date is None else cls._parse_datetime(cr_date),
             "up_id": cls._find_text(element, f"./{cls._namespace}:upID"),
-            "up_date": cls._optional(
-                parse_datetime, cls._find_text(element, f"./{cls._namespace}:upDate")
-            ),
-            "tr_date": cls._optional(
-                parse_datetime, cls._find_text(element, f"./{cls._namespace}:trDate")
-            ),
+            "up_date": None if up_date is None else cls._parse_datetime(up_date),
+            "tr_date": None if tr_date is None else cls._parse_datetime(tr_date),
         }
         return params
 
@@ -134,28 +130,26 @@ class InfoDomainResultData(InfoResultData):
         self.contacts = contacts or []
 
     @classmethod
-    def _get_params(cls, element: Element) -> Mapping[str, Any]:
-        params: Mapping[str, Any] = {
-            "name": cls._find_text(element, f"./{cls._namespace}:name"),
-            "registrant": cls._find_text(element, f"./{cls._namespace}:registrant"),
-            "admins": cls._find_all_text(element, f"./{cls._namespace}:admin"),
-            "nsset": cls._find_text(element, f"./{cls._namespace}:nsset"),
-            "keyset": cls._find_text(element, f"./{cls._namespace}:keyset"),
-            "ex_date": cls._optional(
-                cls._parse_date, cls._find_text(element, f"./{cls._namespace}:exDate")
-            ),
-            "auth_info": cls._optional(
-                DomainAuthInfo.extract,
-                cls._find(element, f"./{cls._namespace}:authInfo"),
-            ),
-        }
+    def _get_params(cls, element: Element) -> Dict[str, Any]:
+        auth_info = cls._find(element, f"./{cls._namespace}:authInfo")
+        ex_date = cls._find_text(element, f"./{cls._namespace}:exDate")
+        params = super()._get_params(element)
+        params["name"] = cls._find_text(element, f"./{cls._namespace}:name")
+        params["registrant"] = cls._find_text(element, f"./{cls._namespace}:registrant")
+        params["admins"] = cls._find_all_text(element, f"./{cls._namespace}:admin")
+        params["nsset"] = cls._find_text(element, f"./{cls._namespace}:nsset")
+        params["keyset"] = cls._find_text(element, f"./{cls._namespace}:keyset")
+        params["ex_date"] = None if ex_date is None else cls._parse_date(ex_date)
+        params["auth_info"] = (
+            None if auth_info is None else DomainAuthInfo.extract(auth_info)
+        )
         ns = cls._find(element, f"./{InfoDomainResultData._namespace}:ns")
         contacts = cls._find_all(element, f"./{cls._namespace}:contact")
         if ns is not None:
             params["hosts"] = cls._find_all_text(ns, f"./{cls._namespace}:hostObj")
         if contacts:
             params["contacts"] = [DomainContact.extract(item) for item in contacts]
-        return {**super()._get_params(element), **params}
+        return params
 
 
 @dataclass
@@ -180,15 +174,14 @@ class InfoHostResultData(InfoResultData):
     addrs: Optional[List[Ip]] = field(default_factory=list)
 
     @classmethod
-    def _get_params(cls, element: Element) -> Mapping[str, Any]:
-        params: Mapping[str, Any] = {
-            "name": cls._find_text(element, f"./{cls._namespace}:name"),
-            "addrs": [
-                Ip.extract(item)
-                for item in cls._find_all(element, f"./{cls._namespace}:addr")
-            ],
-        }
-        return {**super()._get_params(element), **params}
+    def _get_params(cls, element: Element) -> Dict[str, Any]:
+        params = super()._get_params(element)
+        params["name"] = cls._find_text(element, f"./{cls._namespace}:name")
+        params["addrs"] = [
+            Ip.extract(item)
+            for item in cls._find_all(element, f"./{cls._namespace}:addr")
+        ]
+        return params
 
 
 @dataclass
@@ -228,29 +221,28 @@ class InfoContactResultData(InfoResultData):
     auth_info: Optional[Union[str, ContactAuthInfo]]
 
     @classmethod
-    def _get_params(cls, element: Element) -> Mapping[str, Any]:
-        params: Mapping[str, Any] = {
-            "id": cls._find_text(element, f"./{cls._namespace}:id"),
-            "postal_info": PostalInfo.extract(
-                cls._find(element, f"./{cls._namespace}:postalInfo")
-            ),
-            "voice": cls._find_text(element, f"./{cls._namespace}:voice"),
-            "fax": cls._find_text(element, f"./{cls._namespace}:fax"),
-            "email": cls._find_text(element, f"./{cls._namespace}:email"),
-            "disclose": cls._optional(
-                Disclose.extract, cls._find(element, f"./{cls._namespace}:disclose")
-            ),
-            "vat": cls._find_text(element, f"./{cls._namespace}:vat"),
-            "ident": cls._optional(
-                Ident.extract, cls._find(element, f"./{cls._namespace}:ident")
-            ),
-            "notify_email": cls._find_text(element, f"./{cls._namespace}:notifyEmail"),
-            "auth_info": cls._optional(
-                ContactAuthInfo.extract,
-                cls._find(element, f"./{cls._namespace}:authInfo"),
-            ),
-        }
-        return {**super()._get_params(element), **params}
+    def _get_params(cls, element: Element) -> Dict[str, Any]:
+        disclose = cls._find(element, f"./{cls._namespace}:disclose")
+        ident = cls._find(element, f"./{cls._namespace}:ident")
+        auth_info = cls._find(element, f"./{cls._namespace}:authInfo")
+        params = super()._get_params(element)
+        params["id"] = cls._find_text(element, f"./{cls._namespace}:id")
+        params["postal_info"] = PostalInfo.extract(
+            cls._find(element, f"./{cls._namespace}:postalInfo")
+        )
+        params["voice"] = cls._find_text(element, f"./{cls._namespace}:voice")
+        params["fax"] = cls._find_text(element, f"./{cls._namespace}:fax")
+        params["email"] = cls._find_text(element, f"./{cls._namespace}:email")
+        params["disclose"] = None if disclose is None else Disclose.extract(disclose)
+        params["vat"] = cls._find_text(element, f"./{cls._namespace}:vat")
+        params["ident"] = None if ident is None else Ident.extract(ident)
+        params["notify_email"] = cls._find_text(
+            element, f"./{cls._namespace}:notifyEmail"
+        )
+        params["auth_info"] = (
+            None if auth_info is None else ContactAuthInfo.extract(auth_info)
+        )
+        return params
 
 
 @dataclass
@@ -278,17 +270,16 @@ class InfoKeysetResultData(InfoResultData):
     auth_info: Optional[str]
 
     @classmethod
-    def _get_params(cls, element: Element) -> Mapping[str, Any]:
-        params: Mapping[str, Any] = {
-            "id": cls._find_text(element, f"./{cls._namespace}:id"),
-            "dnskeys": [
-                Dnskey.extract(item)
-                for item in cls._find_all(element, f"./{cls._namespace}:dnskey")
-            ],
-            "techs": cls._find_all_text(element, f"./{cls._namespace}:tech"),
-            "auth_info": cls._find_text(element, f"./{cls._namespace}:authInfo"),
-        }
-        return {**super()._get_params(element), **params}
+    def _get_params(cls, element: Element) -> Dict[str, Any]:
+        params = super()._get_params(element)
+        params["id"] = cls._find_text(element, f"./{cls._namespace}:id")
+        params["dnskeys"] = [
+            Dnskey.extract(item)
+            for item in cls._find_all(element, f"./{cls._namespace}:dnskey")
+        ]
+        params["techs"] = cls._find_all_text(element, f"./{cls._namespace}:tech")
+        params["auth_info"] = cls._find_text(element, f"./{cls._namespace}:authInfo")
+        return params
 
 
 @dataclass
@@ -318,17 +309,16 @@ class InfoNssetResultData(InfoResultData):
     auth_info: Optional[str]
 
     @classmethod
-    def _get_params(cls, element: Element) -> Mapping[str, Any]:
-        params: Mapping[str, Any] = {
-            "id": cls._find_text(element, f"./{cls._namespace}:id"),
-            "nss": [
-                Ns.extract(item)
-                for item in cls._find_all(element, f"./{cls._namespace}:ns")
-            ],
-            "techs": cls._find_all_text(element, f"./{cls._namespace}:tech"),
-            "reportlevel": int(
-                cls._find_text(element, f"./{cls._namespace}:reportlevel")
-            ),
-            "auth_info": cls._find_text(element, f"./{cls._namespace}:authInfo"),
-        }
-        return {**super()._get_params(element), **params}
+    def _get_params(cls, element: Element) -> Dict[str, Any]:
+        params = super()._get_params(element)
+        params["id"] = cls._find_text(element, f"./{cls._namespace}:id")
+        params["nss"] = [
+            Ns.extract(item)
+            for item in cls._find_all(element, f"./{cls._namespace}:ns")
+        ]
+        params["techs"] = cls._find_all_text(element, f"./{cls._namespace}:tech")
+        params["reportlevel"] = int(
+            cls._find_text(element, f"./{cls._namespace}:reportlevel")
+        )
+        params["auth_info"] = cls._find_text(element, f"./{cls._namespace}:authInfo")
+        return params
@@ -21,21 +21,25 @@ import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
+from sys import intern
 from typing import (
+    TYPE_CHECKING,
     Any,
     ClassVar,
+    Dict,
     Generic,
+    Iterator,
     List,
     Mapping,
     Optional,
     Sequence,
+    Tuple,
     Type,
     TypeVar,
     Union,
     cast,
 )
 
-from dateutil.parser import parse as parse_datetime
 from dateutil.relativedelta import relativedelta
 from lxml.etree import Element, QName, XMLSchema
 
@@ -44,7 +48,7 @@ from epplib.exceptions import ParsingError
 from epplib.models import ExtractModelMixin, Statement
 from epplib.responses.extensions import EXTENSIONS, ResponseExtension
 from epplib.responses.poll_messages import POLL_MESSAGE_TYPES, PollMessage
-from epplib.utils import ParseXMLMixin, safe_parse
+from epplib.utils import DATACLASS_SLOTS, ParseXMLMixin, safe_iterparse, safe_parse
 
 LOGGER = logging.getLogger(__name__)
 
@@ -52,6 +56,22 @@ T = TypeVar("T", bound=ExtractModelMixin)
 ResponseT = TypeVar("ResponseT", bound="Response")
 ResultT = TypeVar("ResultT", bound="Result")
 
+# Tags in the Clark notation, which is used by lxml for element tags.
+_TAG_EPP = QName(NAMESPACE.EPP, "epp").text
+_TAG_SV_ID = QName(NAMESPACE.EPP, "svID").text
+_TAG_SV_DATE = QName(NAMESPACE.EPP, "svDate").text
+_TAG_SVC_MENU = QName(NAMESPACE.EPP, "svcMenu").text
+_TAG_VERSION = QName(NAMESPACE.EPP, "version").text
+_TAG_LANG = QName(NAMESPACE.EPP, "lang").text
+_TAG_OBJ_URI = QName(NAMESPACE.EPP, "objURI").text
+_TAG_SVC_EXTENSION = QName(NAMESPACE.EPP, "svcExtension").text
+_TAG_DCP = QName(NAMESPACE.EPP, "dcp").text
+_TAG_ACCESS = QName(NAMESPACE.EPP, "access").text
+_TAG_STATEMENT = QName(NAMESPACE.EPP, "statement").text
+_TAG_EXPIRY = QName(NAMESPACE.EPP, "expiry").text
+_TAG_ABSOLUTE = QName(NAMESPACE.EPP, "absolute").text
+_TAG_RELATIVE = QName(NAMESPACE.EPP, "relative").text
+
 GreetingPayload = Mapping[
     str, Union[None, Sequence[str], Sequence[Statement], datetime, relativedelta, str]
 ]
@@ -64,11 +84,22 @@ class Response(ParseXMLMixin, ABC):
         tag: Expected tag enclosing the response payload.
     """
 
-    _payload_tag: ClassVar[QName]
+    __slots__ = ()
+
+    _payload_tag: ClassVar[str]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Payload tag is compared to the element tag, which is a string in Clark notation.
+        payload_tag = vars(cls).get("_payload_tag")
+        if isinstance(payload_tag, QName):
+            cls._payload_tag = payload_tag.text
 
-    # Concrete Responses are supposed to be dataclasses. ABC can not be a dataclass. We need to specify init for typing.
-    def __init__(self, *args: Any, **kwargs: Any) -> None:
-        pass  # pragma: no cover
+    if TYPE_CHECKING:
+        # Concrete Responses are supposed to be dataclasses. ABC can not be a dataclass. We need to specify init for
+        # typing, the dataclasses generate their own at runtime.
+        def __init__(self, *args: Any, **kwargs: Any) -> None:
+            pass  # pragma: no cover
 
     @classmethod
     def parse(
@@ -94,7 +125,7 @@ class Response(ParseXMLMixin, ABC):
         if schema is not None:
             schema.assertValid(root)
 
-        if root.tag != QName(NAMESPACE.EPP, "epp"):
+        if root.tag != _TAG_EPP:
             raise ValueError('Root element has to be "epp". Found: {}'.format(root.tag))
 
         payload = root[0]
@@ -121,7 +152,7 @@ class Response(ParseXMLMixin, ABC):
         """
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Greeting(Response):
     """EPP Greeting representation.
 
@@ -137,7 +168,14 @@ class Greeting(Response):
         expiry: Content of the epp/greeting/expiry element.
     """
 
-    _payload_tag: ClassVar = QName(NAMESPACE.EPP, "greeting")
+    _payload_tag: ClassVar = QName(NAMESPACE.EPP, "greeting").text
+
+    # Types of the expiry and the names of the methods to parse them by the tag of the expiry.
+    # The methods are looked up on the class, so the subclasses may override them.
+    _EXPIRY_PARSERS: ClassVar[Mapping[str, Tuple[str, str]]] = {
+        _TAG_ABSOLUTE: ("absolute", "_parse_datetime"),
+        _TAG_RELATIVE: ("relative", "_parse_duration"),
+    }
 
     sv_id: str
     sv_date: str
@@ -159,7 +197,7 @@ class Greeting(Response):
             raw_response: The raw XML response which will be parsed into the Response object.
             schema: A XML schema used to validate the parsed Response. No validation is done if schema is None.
         """
-        return super().parse(raw_response, schema)
+        return super(Greeting, cls).parse(raw_response, schema)
 
     @classmethod
     def _extract_payload(cls, element: Element) -> GreetingPayload:
@@ -168,29 +206,73 @@ class Greeting(Response):
         Args:
             element: Child element of the epp element.
         """
-        data = {
-            "sv_id": cls._find_text(element, "./epp:svID"),
-            "sv_date": cls._find_text(element, "./epp:svDate"),
-            "versions": cls._find_all_text(element, "./epp:svcMenu/epp:version"),
-            "langs": cls._find_all_text(element, "./epp:svcMenu/epp:lang"),
-            "obj_uris": cls._find_all_text(element, "./epp:svcMenu/epp:objURI"),
-            "ext_uris": cls._find_all_text(
-                element, "./epp:svcMenu/epp:svcExtension/epp:extURI"
-            ),
-            "access": cls._find_child(element, "./epp:dcp/epp:access"),
-            "statements": [
-                Statement.extract(item)
-                for item in cls._find_all(element, "./epp:dcp/epp:statement")
-            ],
-            "expiry": cls._extract_expiry(
-                element.find("./epp:dcp/epp:expiry", namespaces=cls._NAMESPACES)
-            ),
+        data: Dict[str, Any] = {
+            "sv_id": None,
+            "sv_date": None,
+            "versions": [],
+            "langs": [],
+            "obj_uris": [],
+            "ext_uris": [],
+            "access": None,
+            "statements": [],
+            "expiry": None,
         }
+        # The structure of the greeting is fixed, so it is walked through only once.
+        for child in element:
+            # lxml creates the tag string on every access.
+            tag = child.tag
+            if tag == _TAG_SV_ID:
+                data["sv_id"] = intern(child.text or "")
+            elif tag == _TAG_SV_DATE:
+                data["sv_date"] = child.text or ""
+            elif tag == _TAG_SVC_MENU:
+                cls._extract_svc_menu(child, data)
+            elif tag == _TAG_DCP:
+                cls._extract_dcp(child, data)
 
         return data
 
     @classmethod
-    def _extract_expiry(cls, element: Element) -> Union[None, datetime, relativedelta]:
+    def _extract_svc_menu(cls, element: Element, data: Dict[str, Any]) -> None:
+        """Extract the svcMenu part of Greeting into the data.
+
+        Args:
+            element: svcMenu epp element.
+            data: Greeting data to be filled.
+        """
+        # The values are the same in every greeting, so they are interned.
+        for item in element:
+            tag = item.tag
+            if tag == _TAG_VERSION:
+                data["versions"].append(intern(item.text or ""))
+            elif tag == _TAG_LANG:
+                data["langs"].append(intern(item.text or ""))
+            elif tag == _TAG_OBJ_URI:
+                data["obj_uris"].append(intern(item.text or ""))
+            elif tag == _TAG_SVC_EXTENSION:
+                data["ext_uris"] += [
+                    intern(uri) for uri in cls._find_all_text(item, "./epp:extURI")
+                ]
+
+    @classmethod
+    def _extract_dcp(cls, element: Element, data: Dict[str, Any]) -> None:
+        """Extract the dcp part of Greeting into the data.
+
+        Args:
+            element: dcp epp element.
+            data: Greeting data to be filled.
+        """
+        for item in element:
+            tag = item.tag
+            if tag == _TAG_ACCESS:
+                data["access"] = cls._find_child(item, ".")
+            elif tag == _TAG_STATEMENT:
+                data["statements"].append(Statement.extract(item))
+            elif tag == _TAG_EXPIRY:
+                data["expiry"] = cls._extract_expiry(item)
+
+    @classmethod
+    def _extract_expiry(cls, element: Element) -> Union[datetime, relativedelta]:
         """Extract the expiry part of Greeting.
 
         Result depends on whether the expiry is relative or absolute. Absolute expiry is returned as datetime whereas
@@ -206,33 +288,24 @@ class Greeting(Response):
             ParsingError: If parsing of the expiry date fails.
             ValueError: If expiry is found but it does not contain "absolute" or "relative" subelement.
         """
-        if element is None:
-            return None
-
-        tag = element[0].tag
-        text = element[0].text
-
-        if tag == QName(NAMESPACE.EPP, "absolute"):
-            try:
-                return parse_datetime(text)
-            except ValueError as exception:
-                raise ParsingError(
-                    'Could not parse "{}" as absolute expiry.'.format(text)
-                ) from exception
-        elif tag == QName(NAMESPACE.EPP, "relative"):
-            try:
-                return cls._parse_duration(text)
-            except ValueError as exception:
-                raise ParsingError(
-                    'Could not parse "{}" as relative expiry.'.format(text)
-                ) from exception
-        else:
+        expiry = element[0]
+        try:
+            expiry_type, parser_name = cls._EXPIRY_PARSERS[expiry.tag]
+        except KeyError:
             raise ValueError(
-                'Expected expiry specification. Found "{}" instead.'.format(tag)
-            )
+                'Expected expiry specification. Found "{}" instead.'.format(expiry.tag)
+            ) from None
 
+        try:
+            parse_expiry = getattr(cls, parser_name)
+            return cast(Union[datetime, relativedelta], parse_expiry(expiry.text))
+        except ValueError as exception:
+            raise ParsingError(
+                'Could not parse "{}" as {} expiry.'.format(expiry.text, expiry_type)
+            ) from exception
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class MsgQ(ParseXMLMixin):
     """Dataclass to represent EPP msgQ element.
 
@@ -253,7 +326,9 @@ class MsgQ(ParseXMLMixin):
         """Extract MsgQ from the element."""
         count = cls._optional(int, cls._find_attrib(element, ".", "count"))
         id = cls._find_attrib(element, ".", "id")
-        q_date = cls._optional(parse_datetime, cls._find_text(element, "./epp:qDate"))
+        q_date = cls._optional(
+            cls._parse_datetime, cls._find_text(element, "./epp:qDate")
+        )
         msg = cls._extract_message(cls._find(element, "./epp:msg"))
         return cls(count=count, id=id, q_date=q_date, msg=msg)
 
@@ -275,7 +350,7 @@ class MsgQ(ParseXMLMixin):
                 return message_class.extract(message_element)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Result(Response, Generic[T]):
     """EPP Result representation.
 
@@ -289,7 +364,7 @@ class Result(Response, Generic[T]):
         msg_q: Content of the epp/response/msgQ element.
     """
 
-    _payload_tag: ClassVar = QName(NAMESPACE.EPP, "response")
+    _payload_tag: ClassVar = QName(NAMESPACE.EPP, "response").text
     _res_data_class: ClassVar[Optional[Type[ExtractModelMixin]]] = None
     _res_data_path: ClassVar[Optional[str]] = None
 
@@ -311,7 +386,48 @@ class Result(Response, Generic[T]):
             raw_response: The raw XML response which will be parsed into the Response object.
             schema: A XML schema used to validate the parsed Response. No validation is done if schema is None.
         """
-        return super().parse(raw_response, schema)
+        return super(Result, cls).parse(raw_response, schema)
+
+    @classmethod
+    def iter_res_data(cls, raw_response: bytes) -> Iterator[T]:
+        """Iterate over the items of the resData element of the xml response.
+
+        The response is parsed incrementally and every item is dropped from the parsed
+        tree once it is extracted. Unlike parse, the whole document is never held in
+        the memory, which is useful for responses with a large number of items. The
+        rest of the response is ignored and it is not validated.
+
+        Args:
+            raw_response: The raw XML response from which the items are extracted.
+
+        Raises:
+            ParsingError: If parsing fails for whatever reason. ParsingError wraps the original exceptions and adds the
+                raw data received from the server to ease the debugging.
+        """
+        if cls._res_data_path is None or cls._res_data_class is None:
+            return
+
+        path = [
+            _TAG_EPP,
+            cls._payload_tag,
+            QName(NAMESPACE.EPP, "resData").text,
+        ]
+        for step in cls._res_data_path.split("/")[1:]:
+            prefix, localname = step.split(":")
+            path.append(QName(cls._NAMESPACES[prefix], localname).text)
+        *parents, tag = path
+
+        try:
+            for item in safe_iterparse(raw_response, tag):
+                if [parent.tag for parent in item.iterancestors()][::-1] != parents:
+                    continue
+                yield cast(T, cls._res_data_class.extract(item))
+                # Drop the processed items to keep the parsed tree small.
+                item.clear()
+                while item.getprevious() is not None:
+                    del item.getparent()[0]
+        except Exception as exception:
+            raise ParsingError(raw_response=raw_response) from exception
 
     @classmethod
     def _extract_payload(cls, element: Element) -> Mapping[str, Any]:
@@ -320,18 +436,17 @@ class Result(Response, Generic[T]):
         Args:
             element: Child element of the epp element.
         """
+        find = cls._find
+        find_text = cls._find_text
+        code = cls._find_attrib(element, "./epp:result", "code")
         payload_data = {
-            "code": cls._optional(
-                int, cls._find_attrib(element, "./epp:result", "code")
-            ),
-            "msg": cls._find_text(element, "./epp:result/epp:msg"),
-            "res_data": cls._extract_data(cls._find(element, "./epp:resData")),
-            "cl_tr_id": cls._find_text(element, "./epp:trID/epp:clTRID"),
-            "sv_tr_id": cls._find_text(element, "./epp:trID/epp:svTRID"),
-            "extensions": cls._extract_extensions(
-                cls._find(element, "./epp:extension")
-            ),
-            "msg_q": cls._extract_message(cls._find(element, "./epp:msgQ")),
+            "code": None if code is None else int(code),
+            "msg": find_text(element, "./epp:result/epp:msg"),
+            "res_data": cls._extract_data(find(element, "./epp:resData")),
+            "cl_tr_id": find_text(element, "./epp:trID/epp:clTRID"),
+            "sv_tr_id": find_text(element, "./epp:trID/epp:svTRID"),
+            "extensions": cls._extract_extensions(find(element, "./epp:extension")),
+            "msg_q": cls._extract_message(find(element, "./epp:msgQ")),
         }
         return payload_data
 
@@ -349,25 +464,25 @@ class Result(Response, Generic[T]):
         ):
             data = None
         else:
-            data = []
-            for item in element.findall(cls._res_data_path, namespaces=cls._NAMESPACES):
-                item_data = cast(T, cls._res_data_class.extract(item))
-                data.append(item_data)
+            extract = cls._res_data_class.extract
+            items = cls._find_all(element, cls._res_data_path)
+            # Cast the whole list at once, typing.cast is a regular function call.
+            data = cast(List[T], [extract(item) for item in items])
         return data
 
     @classmethod
     def _extract_extensions(
         cls, element: Optional[Element]
     ) -> Sequence[ResponseExtension]:
-        data = []
+        data: List[ResponseExtension] = []
         if element is not None:
+            get_extension_class = EXTENSIONS.get
             for child in element:
-                extension_class = EXTENSIONS.get(child.tag, None)
+                tag = child.tag
+                extension_class = get_extension_class(tag)
                 if extension_class is None:
                     LOGGER.warning(
-                        "Could not find class to extract extension {}.".format(
-                            child.tag
-                        )
+                        "Could not find class to extract extension {}.".format(tag)
                     )
                 else:
                     data.append(extension_class.extract(child))
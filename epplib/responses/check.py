@@ -28,9 +28,10 @@ from epplib.models.check import (
     CheckNssetResultData,
 )
 from epplib.responses.base import Result
+from epplib.utils import DATACLASS_SLOTS
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CheckDomainResult(Result[CheckDomainResultData]):
     """Represents EPP Result which responds to the Check domain command.
 
@@ -46,7 +47,7 @@ class CheckDomainResult(Result[CheckDomainResultData]):
     _res_data_class = CheckDomainResultData
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CheckContactResult(Result[CheckContactResultData]):
     """Represents EPP Result which responds to the Check contact command.
 
@@ -62,7 +63,7 @@ class CheckContactResult(Result[CheckContactResultData]):
     _res_data_class = CheckContactResultData
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CheckHostResult(Result[CheckHostResultData]):
     """Represents EPP Result which responds to the Check host command.
 
@@ -78,7 +79,7 @@ class CheckHostResult(Result[CheckHostResultData]):
     _res_data_class = CheckHostResultData
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CheckNssetResult(Result[CheckNssetResultData]):
     """Represents EPP Result which responds to the Check nsset command.
 
@@ -94,7 +95,7 @@ class CheckNssetResult(Result[CheckNssetResultData]):
     _res_data_class = CheckNssetResultData
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CheckKeysetResult(Result[CheckKeysetResultData]):
     """Represents EPP Result which responds to the Check keyset command.
 
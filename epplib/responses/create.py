@@ -29,9 +29,10 @@ from epplib.models.create import (
     CreateNssetResultData,
 )
 from epplib.responses.base import Result, T
+from epplib.utils import DATACLASS_SLOTS
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CreateDomainResult(Result[CreateDomainResultData]):
     """Represents EPP Result which responds to the create domain command.
 
@@ -47,7 +48,7 @@ class CreateDomainResult(Result[CreateDomainResultData]):
     _res_data_class = CreateDomainResultData
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CreateNonDomainResult(Result[T]):
     """Represents EPP Result which responds to the create command for objects other than domain.
 
@@ -60,10 +61,9 @@ class CreateNonDomainResult(Result[T]):
     """
 
     _namespace_prefix: ClassVar[Optional[str]] = None
-    _res_data_path = "./{}:creData".format(_namespace_prefix)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CreateContactResult(CreateNonDomainResult[CreateContactResultData]):
     """Represents EPP Result which responds to the create contact command.
 
@@ -76,11 +76,11 @@ class CreateContactResult(CreateNonDomainResult[CreateContactResultData]):
     """
 
     _namespace_prefix: ClassVar[Optional[str]] = "contact"
-    _res_data_path = "./{}:creData".format(_namespace_prefix)
+    _res_data_path = "./contact:creData"
     _res_data_class = CreateContactResultData
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CreateHostResult(CreateNonDomainResult[CreateHostResultData]):
     """Represents EPP Result which responds to the create host command.
 
@@ -93,11 +93,11 @@ class CreateHostResult(CreateNonDomainResult[CreateHostResultData]):
     """
 
     _namespace_prefix: ClassVar[Optional[str]] = "host"
-    _res_data_path = "./{}:creData".format(_namespace_prefix)
+    _res_data_path = "./host:creData"
     _res_data_class = CreateHostResultData
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CreateNssetResult(CreateNonDomainResult[CreateNssetResultData]):
     """Represents EPP Result which responds to the create nsset command.
 
@@ -110,11 +110,11 @@ class CreateNssetResult(CreateNonDomainResult[CreateNssetResultData]):
     """
 
     _namespace_prefix: ClassVar[Optional[str]] = "nsset"
-    _res_data_path = "./{}:creData".format(_namespace_prefix)
+    _res_data_path = "./nsset:creData"
     _res_data_class = CreateNssetResultData
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CreateKeysetResult(CreateNonDomainResult[CreateKeysetResultData]):
     """Represents EPP Result which responds to the create keyset command.
 
@@ -127,5 +127,5 @@ class CreateKeysetResult(CreateNonDomainResult[CreateKeysetResultData]):
     """
 
     _namespace_prefix: ClassVar[Optional[str]] = "keyset"
-    _res_data_path = "./{}:creData".format(_namespace_prefix)
+    _res_data_path = "./keyset:creData"
     _res_data_class = CreateKeysetResultData
@@ -22,9 +22,10 @@ from dataclasses import dataclass
 
 from epplib.models.credit_info import CreditInfoResultData
 from epplib.responses.base import Result
+from epplib.utils import DATACLASS_SLOTS
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CreditInfoResult(Result[CreditInfoResultData]):
     """Represents EPP Result which responds to the Check domain command.
 
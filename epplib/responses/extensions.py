@@ -21,14 +21,18 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import date
-from typing import ClassVar, Dict, Mapping, Optional, Sequence, Type
+from typing import ClassVar, Dict, List, Mapping, Optional, Sequence, Type
 
 from lxml.etree import Element, QName
 
 from epplib.constants import NAMESPACE
 from epplib.models import ExtraAddr
 from epplib.models.common import DSData, DNSSECKeyData
-from epplib.utils import ParseXMLMixin
+from epplib.utils import DATACLASS_SLOTS, ParseXMLMixin
+
+_TAG_MAX_SIG_LIFE = QName(NAMESPACE.SEC_DNS, "maxSigLife").text
+_TAG_DS_DATA = QName(NAMESPACE.SEC_DNS, "dsData").text
+_TAG_KEY_DATA = QName(NAMESPACE.SEC_DNS, "keyData").text
 
 
 class ResponseExtension(ABC):
@@ -38,6 +42,8 @@ class ResponseExtension(ABC):
         tag: The tag of the root element of the extension.
     """
 
+    __slots__ = ()
+
     tag: ClassVar[QName]
 
     @classmethod
@@ -53,7 +59,7 @@ class ResponseExtension(ABC):
         """
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class EnumInfoExtension(ParseXMLMixin, ResponseExtension):
     """Dataclass to represent CZ.NIC ENUM extension.
 
@@ -83,16 +89,16 @@ class EnumInfoExtension(ParseXMLMixin, ResponseExtension):
         Returns:
             Dataclass representing the extension.
         """
-        val_ex_date = cls._optional(
-            cls._parse_date, cls._find_text(element, "./enumval:valExDate")
+        val_ex_date = cls._find_text(element, "./enumval:valExDate")
+        # _str_to_bool handles None by itself.
+        publish = cls._str_to_bool(cls._find_text(element, "./enumval:publish"))
+        return cls(
+            val_ex_date=None if val_ex_date is None else cls._parse_date(val_ex_date),
+            publish=publish,
         )
-        publish = cls._optional(
-            cls._str_to_bool, cls._find_text(element, "./enumval:publish")
-        )
-        return cls(val_ex_date=val_ex_date, publish=publish)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class MailingAddressExtension(ParseXMLMixin, ResponseExtension):
     """Dataclass to represent CZ.NIC ENUM extension.
 
@@ -126,7 +132,7 @@ class MailingAddressExtension(ParseXMLMixin, ResponseExtension):
         return cls(addr=addr)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class DNSSECExtension(ParseXMLMixin, ResponseExtension):
     """Dataclass to represent secDNS as returned by InfoResponse
 
@@ -158,30 +164,27 @@ class DNSSECExtension(ParseXMLMixin, ResponseExtension):
         Returns:
             Dataclass representing the extension.
         """
-        maxSigLife = cls._optional(int, cls._find_text(element, "./secDNS:maxSigLife"))
-
-        allDsData = cls._find_all(element, "./secDNS:dsData")
-        allKeyData = cls._find_all(element, "./secDNS:keyData")
-
-        dsData = (
-            [cls._optional(DSData.extract, dsElement) for dsElement in allDsData]
-            if len(allDsData) > 0
-            else None
-        )
-        keyData = (
-            [
-                cls._optional(DNSSECKeyData.extract, keyElement)
-                for keyElement in allKeyData
-            ]
-            if len(allKeyData) > 0
-            else None
+        maxSigLife = None
+        dsData: List[DSData] = []
+        keyData: List[DNSSECKeyData] = []
+        # Walk through the children only once.
+        for child in element:
+            tag = child.tag
+            if tag == _TAG_DS_DATA:
+                dsData.append(DSData.extract(child))
+            elif tag == _TAG_KEY_DATA:
+                keyData.append(DNSSECKeyData.extract(child))
+            elif tag == _TAG_MAX_SIG_LIFE:
+                maxSigLife = int(child.text or "")
+
+        return cls(
+            maxSigLife=maxSigLife, dsData=dsData or None, keyData=keyData or None
         )
 
-        return cls(maxSigLife=maxSigLife, dsData=dsData, keyData=keyData)
-
 
-EXTENSIONS: Dict[QName, Type[ResponseExtension]] = {
-    EnumInfoExtension.tag: EnumInfoExtension,
-    MailingAddressExtension.tag: MailingAddressExtension,
-    DNSSECExtension.tag: DNSSECExtension,
+# Keyed by the Clark notation of the tags, so the lookup by element tag is a plain string lookup.
+EXTENSIONS: Dict[str, Type[ResponseExtension]] = {
+    EnumInfoExtension.tag.text: EnumInfoExtension,
+    MailingAddressExtension.tag.text: MailingAddressExtension,
+    DNSSECExtension.tag.text: DNSSECExtension,
 }
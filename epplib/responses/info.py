@@ -28,9 +28,10 @@ from epplib.models.info import (
     InfoNssetResultData,
 )
 from epplib.responses.base import Result
+from epplib.utils import DATACLASS_SLOTS
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class InfoDomainResult(Result[InfoDomainResultData]):
     """Represents EPP Result which responds to the Info domain command.
 
@@ -46,7 +47,7 @@ class InfoDomainResult(Result[InfoDomainResultData]):
     _res_data_class = InfoDomainResultData
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class InfoContactResult(Result[InfoContactResultData]):
     """Represents EPP Result which responds to the Info contact command.
 
@@ -62,7 +63,7 @@ class InfoContactResult(Result[InfoContactResultData]):
     _res_data_class = InfoContactResultData
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class InfoHostResult(Result[InfoHostResultData]):
     """Represents EPP Result which responds to the Info host command.
 
@@ -78,7 +79,7 @@ class InfoHostResult(Result[InfoHostResultData]):
     _res_data_class = InfoHostResultData
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class InfoKeysetResult(Result[InfoKeysetResultData]):
     """Represents EPP Result which responds to the Info keyset command.
 
@@ -94,7 +95,7 @@ class InfoKeysetResult(Result[InfoKeysetResultData]):
     _res_data_class = InfoKeysetResultData
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class InfoNssetResult(Result[InfoNssetResultData]):
     """Represents EPP Result which responds to the Info nsset command.
 
@@ -22,9 +22,10 @@ from dataclasses import dataclass
 
 from epplib.models.list import GetResultsResultData, ListResultData
 from epplib.responses.base import Result
+from epplib.utils import DATACLASS_SLOTS
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ListResult(Result[ListResultData]):
     """Represents EPP Result which responds to the list command.
 
@@ -40,7 +41,7 @@ class ListResult(Result[ListResultData]):
     _res_data_class = ListResultData
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class GetResultsResult(Result[GetResultsResultData]):
     """Represents EPP Result which responds to the get results command.
 
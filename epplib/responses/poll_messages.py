@@ -23,7 +23,6 @@ from datetime import date, datetime
 from decimal import Decimal
 from typing import Any, ClassVar, Generic, Mapping, Sequence, Type, TypeVar, cast
 
-from dateutil.parser import parse as parse_datetime
 from lxml.etree import Element, QName
 
 from epplib.constants import NAMESPACE
@@ -113,8 +112,8 @@ class RequestUsage(ParseXMLMixin, PollMessage):
     @classmethod
     def extract(cls, element: Element) -> "RequestUsage":
         """Extract the Message from the element."""
-        period_from = parse_datetime(cls._find_text(element, "./fred:periodFrom"))
-        period_to = parse_datetime(cls._find_text(element, "./fred:periodTo"))
+        period_from = cls._parse_datetime(cls._find_text(element, "./fred:periodFrom"))
+        period_to = cls._parse_datetime(cls._find_text(element, "./fred:periodTo"))
         total_free_count = int(cls._find_text(element, "./fred:totalFreeCount"))
         used_count = int(cls._find_text(element, "./fred:usedCount"))
         price = Decimal(cls._find_text(element, "./fred:price"))
@@ -535,26 +534,28 @@ class TechnicalCheckResult(ParseXMLMixin, PollMessage):
         return cls(id=id, names=names, results=results)
 
 
-POLL_MESSAGE_TYPES: Mapping[QName, Type["PollMessage"]] = {
-    LowCredit.tag: LowCredit,
-    RequestUsage.tag: RequestUsage,
-    ImpendingExpData.tag: ImpendingExpData,
-    ExpData.tag: ExpData,
-    DnsOutageData.tag: DnsOutageData,
-    DelData.tag: DelData,
-    ImpendingValExpData.tag: ImpendingValExpData,
-    ValExpData.tag: ValExpData,
-    DomainTransfer.tag: DomainTransfer,
-    ContactTransfer.tag: ContactTransfer,
-    KeysetTransfer.tag: KeysetTransfer,
-    NssetTransfer.tag: NssetTransfer,
-    DomainUpdate.tag: DomainUpdate,
-    ContactUpdate.tag: ContactUpdate,
-    KeysetUpdate.tag: KeysetUpdate,
-    NssetUpdate.tag: NssetUpdate,
-    IdleContactDeletion.tag: IdleContactDeletion,
-    IdleKeysetDeletion.tag: IdleKeysetDeletion,
-    IdleNssetDeletion.tag: IdleNssetDeletion,
-    DomainDeletion.tag: DomainDeletion,
-    TechnicalCheckResult.tag: TechnicalCheckResult,
+# Keyed by the Clark notation of the tags, so the lookup by element tag is a plain string lookup.
+# Some tags are defined as plain strings, hence str() instead of QName.text.
+POLL_MESSAGE_TYPES: Mapping[str, Type["PollMessage"]] = {
+    str(LowCredit.tag): LowCredit,
+    str(RequestUsage.tag): RequestUsage,
+    str(ImpendingExpData.tag): ImpendingExpData,
+    str(ExpData.tag): ExpData,
+    str(DnsOutageData.tag): DnsOutageData,
+    str(DelData.tag): DelData,
+    str(ImpendingValExpData.tag): ImpendingValExpData,
+    str(ValExpData.tag): ValExpData,
+    str(DomainTransfer.tag): DomainTransfer,
+    str(ContactTransfer.tag): ContactTransfer,
+    str(KeysetTransfer.tag): KeysetTransfer,
+    str(NssetTransfer.tag): NssetTransfer,
+    str(DomainUpdate.tag): DomainUpdate,
+    str(ContactUpdate.tag): ContactUpdate,
+    str(KeysetUpdate.tag): KeysetUpdate,
+    str(NssetUpdate.tag): NssetUpdate,
+    str(IdleContactDeletion.tag): IdleContactDeletion,
+    str(IdleKeysetDeletion.tag): IdleKeysetDeletion,
+    str(IdleNssetDeletion.tag): IdleNssetDeletion,
+    str(DomainDeletion.tag): DomainDeletion,
+    str(TechnicalCheckResult.tag): TechnicalCheckResult,
 }
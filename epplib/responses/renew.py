@@ -22,9 +22,10 @@ from dataclasses import dataclass
 
 from epplib.models.renew import RenewDomainResultData
 from epplib.responses.base import Result
+from epplib.utils import DATACLASS_SLOTS
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class RenewDomainResult(Result[RenewDomainResultData]):
     """Represents EPP Result which responds to the Renew domain command.
 
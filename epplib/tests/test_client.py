@@ -147,6 +147,19 @@ class TestClient(TestCase):
         )
         self.assertEqual(cast(DummyResponse, response).schema, mock_schema)
 
+    def test_receive_no_validation(self):
+        mock_schema = Mock(spec=XMLSchema)
+        mock_schema.assertValid = (
+            Mock()
+        )  # Otherwise we get AttributeError: Attributes cannot start with 'assert'
+        client = Client(DummyTransport(), mock_schema, validate_responses=False)
+
+        with client:
+            response = client._receive(DummyResponse)
+
+        self.assertEqual(type(response), DummyResponse)
+        self.assertIsNone(cast(DummyResponse, response).schema)
+
     @freeze_time("2021-05-04 12:21")
     @patch("epplib.client.choices")
     def test_send(self, mock_choices):
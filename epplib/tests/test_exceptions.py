@@ -28,3 +28,14 @@ class TestParsingError(TestCase):
         self.assertEqual(
             str(ParsingError(raw_response="Gazpacho!")), "Raw response:\n'Gazpacho!'"
         )
+        self.assertEqual(str(ParsingError(raw_response=12)), "Raw response:\n12")
+
+    def test_str_truncated(self):
+        raw_response = b"x" * (ParsingError.RAW_RESPONSE_MAX_LENGTH + 10)
+        error = ParsingError(raw_response=raw_response)
+        expected = "Raw response:\n{!r}\n... (10 more)".format(
+            raw_response[: ParsingError.RAW_RESPONSE_MAX_LENGTH]
+        )
+        self.assertEqual(str(error), expected)
+        self.assertEqual(str(error), expected)
+        self.assertEqual(error.raw_response, raw_response)
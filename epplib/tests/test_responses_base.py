@@ -112,6 +112,10 @@ class TestResponse(TestCase):
         with self.assertRaisesRegex(ValueError, message):
             DummyResponse.parse(data)
 
+    def test_payload_tag_string(self):
+        self.assertEqual(DummyResponse._payload_tag, QName(NAMESPACE.EPP, "dummy").text)
+        self.assertIsInstance(DummyResponse._payload_tag, str)
+
     def test_parse_with_schema(self):
         invalid = b"""<?xml version="1.0" encoding="UTF-8"?>
                       <epp xmlns="urn:ietf:params:xml:ns:epp-1.0">
@@ -192,6 +196,40 @@ class TestGreeting(TestCase):
 
         self.assertEqual(greeting.expiry, None)
 
+    def test_extract_payload_minimal(self):
+        element = EM.greeting(
+            EM.svID("EPP server"),
+            EM.svDate("2018-05-15T21:05:42+02:00"),
+            EM.svcMenu(EM.version("1.0"), EM.lang("en"), EM.objURI()),
+            EM.dcp(EM.access(), EM.statement()),
+        )
+        data = Greeting._extract_payload(element)
+
+        self.assertEqual(data["sv_id"], "EPP server")
+        self.assertEqual(data["versions"], ["1.0"])
+        self.assertEqual(data["langs"], ["en"])
+        self.assertEqual(data["obj_uris"], [""])
+        self.assertEqual(data["ext_uris"], [])
+        self.assertEqual(data["access"], None)
+        self.assertEqual(data["statements"], [Statement([], [], None)])
+        self.assertEqual(data["expiry"], None)
+
+    def test_extract_payload_unknown(self):
+        element = EM.greeting(
+            EM.svID("EPP server"),
+            EM.svcMenu(EM.version("1.0"), EM.unknown()),
+            EM.dcp(EM.access(EM.none()), EM.unknown()),
+            EM.unknown(),
+        )
+        data = Greeting._extract_payload(element)
+
+        self.assertEqual(data["sv_id"], "EPP server")
+        self.assertEqual(data["versions"], ["1.0"])
+        self.assertEqual(data["ext_uris"], [])
+        self.assertEqual(data["access"], "none")
+        self.assertEqual(data["statements"], [])
+        self.assertEqual(data["expiry"], None)
+
     def test_extract_absolute_expiry_error(self):
         expiry = EM.expiry(EM.absolute("Gazpacho!"))
         with self.assertRaisesRegex(
@@ -206,6 +244,15 @@ class TestGreeting(TestCase):
         ):
             Greeting._extract_expiry(expiry)
 
+    def test_extract_expiry_overridden_parser(self):
+        class CustomGreeting(Greeting):
+            @classmethod
+            def _parse_duration(cls, value: str) -> relativedelta:
+                return relativedelta(days=42)
+
+        expiry = EM.expiry(EM.relative("P1D"))
+        self.assertEqual(CustomGreeting._extract_expiry(expiry), relativedelta(days=42))
+
     def test_extract_expiry_invalid_tag(self):
         expiry = EM.expiry(EM.invalid("2021-05-04T03:14:15+02:00"))
         message = 'Expected expiry specification. Found "{urn:ietf:params:xml:ns:epp-1.0}invalid" instead\\.'
@@ -227,6 +274,10 @@ class ResultTest(TestCase):
         self.assertEqual(result.cl_tr_id, "sdmj001#17-03-06at18:48:03")
         self.assertEqual(result.sv_tr_id, "ReqID-0000126633")
 
+    def test_iter_res_data_no_path(self):
+        xml = (BASE_DATA_PATH / "responses/result.xml").read_bytes()
+        self.assertEqual(list(TestResult.iter_res_data(xml)), [])
+
 
 class TestResultExtensions(TestCase):
     TEST_EXTENSIONS = {
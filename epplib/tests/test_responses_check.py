@@ -18,6 +18,9 @@
 #
 from unittest import TestCase
 
+from lxml.builder import ElementMaker
+
+from epplib.constants import NAMESPACE
 from epplib.models.check import (
     CheckContactResultData,
     CheckDomainResultData,
@@ -49,6 +52,22 @@ class TestCheckDomainResult(TestCase):
         result = CheckDomainResult.parse(xml, SCHEMA)
         self.assertEqual(result.code, 2002)
 
+    def test_iter_res_data(self):
+        xml = (BASE_DATA_PATH / "responses/result_check_domain.xml").read_bytes()
+        expected = [
+            CheckDomainResultData("mydomain.cz", True),
+            CheckDomainResultData("somedomain.cz", False, "already registered."),
+        ]
+        self.assertEqual(list(CheckDomainResult.iter_res_data(xml)), expected)
+
+    def test_extract_missing_name(self):
+        EM = ElementMaker(namespace=NAMESPACE.NIC_DOMAIN)
+        element = EM.cd(EM.reason("already registered."))
+        result = CheckDomainResultData.extract(element)
+        self.assertIsNone(result.name)
+        self.assertIsNone(result.avail)
+        self.assertEqual(result.reason, "already registered.")
+
 
 class TestCheckContactResult(TestCase):
     def test_parse(self):
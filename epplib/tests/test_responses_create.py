@@ -18,11 +18,14 @@
 #
 from datetime import date, datetime, timedelta, timezone
 from unittest import TestCase
+from unittest.mock import patch
 
+from epplib.constants import NAMESPACE
 from epplib.models.create import (
     CreateContactResultData,
     CreateDomainResultData,
     CreateKeysetResultData,
+    CreateNonDomainResultData,
     CreateNssetResultData,
 )
 from epplib.responses import (
@@ -32,6 +35,9 @@ from epplib.responses import (
     CreateNssetResult,
 )
 from epplib.tests.utils import BASE_DATA_PATH, SCHEMA
+from epplib.utils import ParseXMLMixin, safe_parse
+
+IETF_DOMAIN = "urn:ietf:params:xml:ns:domain-1.0"
 
 
 class TestCreateDomainResult(TestCase):
@@ -74,6 +80,24 @@ class TestCreateDomainResult(TestCase):
         result = CreateDomainResult.parse(xml, SCHEMA)
         self.assertEqual(result.code, 2002)
 
+    def test_parse_other_namespace(self):
+        xml_template = (
+            BASE_DATA_PATH / "responses/result_create_domain_template.xml"
+        ).read_bytes()
+        xml = xml_template.replace(
+            b"{exDate}", b"<domain:exDate>2018-08-09</domain:exDate>"
+        ).replace(b"http://www.nic.cz/xml/epp/domain-1.4", IETF_DOMAIN.encode())
+        with patch.dict(ParseXMLMixin._NAMESPACES, {"domain": IETF_DOMAIN}):
+            result = CreateDomainResult.parse(xml)
+        expected = [
+            CreateDomainResultData(
+                "thisdomain.cz",
+                datetime(2017, 8, 9, 12, 31, 49, tzinfo=timezone(timedelta(hours=2))),
+                date(2018, 8, 9),
+            )
+        ]
+        self.assertEqual(result.res_data, expected)
+
 
 class TestCreateContactResult(TestCase):
     def test_parse(self):
@@ -94,6 +118,22 @@ class TestCreateContactResult(TestCase):
         self.assertEqual(result.code, 2002)
 
 
+class TestCreateNonDomainResultData(TestCase):
+    def test_namespace_prefix(self):
+        class CustomResultData(CreateNonDomainResultData):
+            _namespace_prefix = "contact"
+
+        xml = (BASE_DATA_PATH / "responses/result_create_contact.xml").read_bytes()
+        element = safe_parse(xml).find(".//{{{}}}creData".format(NAMESPACE.NIC_CONTACT))
+        self.assertEqual(
+            CustomResultData.extract(element),
+            CustomResultData(
+                "CID-MYCONTACT",
+                datetime(2017, 7, 28, 12, 11, 43, tzinfo=timezone(timedelta(hours=2))),
+            ),
+        )
+
+
 class TestCreateNssetResult(TestCase):
     def test_parse(self):
         xml = (BASE_DATA_PATH / "responses/result_create_nsset.xml").read_bytes()
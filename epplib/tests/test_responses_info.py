@@ -19,6 +19,7 @@
 from datetime import date, datetime, timedelta, timezone
 from unittest import TestCase
 
+from epplib.exceptions import ParsingError
 from epplib.models import (
     ContactAddr,
     Disclose,
@@ -108,6 +109,12 @@ class TestInfoDomainResult(TestCase):
         result = InfoDomainResult.parse(xml, SCHEMA)
         self.assertEqual(result.code, 2002)
 
+    def test_parse_invalid_date(self):
+        xml = (BASE_DATA_PATH / "responses/result_info_domain.xml").read_bytes()
+        xml = xml.replace(b"2017-07-11T13:28:48+02:00", b"invalid")
+        with self.assertRaises(ParsingError):
+            InfoDomainResult.parse(xml)
+
 
 class TestInfoContactResult(TestCase):
     def test_parse_full(self):
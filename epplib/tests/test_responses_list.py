@@ -19,7 +19,7 @@
 from unittest import TestCase
 
 from epplib.models.list import ListResultData
-from epplib.responses import GetResultsResult, ListResult
+from epplib.responses import GetResultsResult, ListResult, ParsingError
 from epplib.tests.utils import BASE_DATA_PATH, SCHEMA
 
 
@@ -53,3 +53,48 @@ class TestGetResultsResult(TestCase):
         xml = (BASE_DATA_PATH / "responses/result_error.xml").read_bytes()
         result = GetResultsResult.parse(xml, SCHEMA)
         self.assertEqual(result.code, 2002)
+
+    def test_iter_res_data(self):
+        xml = (BASE_DATA_PATH / "responses/result_get_results.xml").read_bytes()
+        expected = [
+            "1.1.1.7.4.5.2.2.2.0.2.4.e164.arpa",
+            "mydomain.cz",
+            "thisdomain.cz",
+            "trdomain.cz",
+        ]
+        self.assertEqual(list(GetResultsResult.iter_res_data(xml)), expected)
+
+    def test_iter_res_data_error(self):
+        xml = (BASE_DATA_PATH / "responses/result_error.xml").read_bytes()
+        self.assertEqual(list(GetResultsResult.iter_res_data(xml)), [])
+
+    def test_iter_res_data_other_path(self):
+        xml = b"""<?xml version="1.0" encoding="UTF-8"?>
+                  <epp xmlns="urn:ietf:params:xml:ns:epp-1.0"
+                   xmlns:fred="http://www.nic.cz/xml/epp/fred-1.5">
+                    <response>
+                      <fred:item>ignored.cz</fred:item>
+                      <resData>
+                        <fred:resultsList>
+                          <fred:item>mydomain.cz</fred:item>
+                        </fred:resultsList>
+                      </resData>
+                    </response>
+                  </epp>"""
+        self.assertEqual(list(GetResultsResult.iter_res_data(xml)), ["mydomain.cz"])
+
+    def test_iter_res_data_doctype(self):
+        xml = b"""<?xml version="1.0" encoding="UTF-8"?>
+                  <!DOCTYPE epp>
+                  <epp xmlns="urn:ietf:params:xml:ns:epp-1.0"
+                   xmlns:fred="http://www.nic.cz/xml/epp/fred-1.5">
+                    <response>
+                      <resData>
+                        <fred:resultsList>
+                          <fred:item>mydomain.cz</fred:item>
+                        </fred:resultsList>
+                      </resData>
+                    </response>
+                  </epp>"""
+        with self.assertRaisesRegex(ParsingError, "Raw response"):
+            list(GetResultsResult.iter_res_data(xml))
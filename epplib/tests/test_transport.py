@@ -215,6 +215,31 @@ class TestSocketTransport(TestCase):
         process.join()
         self.assertEqual(received, message)
 
+    @patch("epplib.transport.ssl.create_default_context", autospec=True)
+    def test_receive_chunks(self, context_mock):
+        context_mock.return_value.wrap_socket = lambda x, **kwargs: x
+        server_ready = Event()
+
+        message = b"Message!" * SocketTransport.CHUNK_SIZE
+
+        server_args = {
+            "hostname": self.params["hostname"],
+            "port": self.params["port"],
+            "server_ready": server_ready,
+            "message": message,
+        }
+        process = Process(target=server, kwargs=server_args)
+        process.start()
+
+        server_ready.wait()
+        transport = SocketTransport(**self.params)
+        transport.connect()
+        received = transport.receive()
+        transport.close()
+
+        process.join()
+        self.assertEqual(received, message)
+
     @patch("epplib.transport.ssl.create_default_context", autospec=True)
     def test_receive_empty(self, context_mock):
         context_mock.return_value.wrap_socket = lambda x, **kwargs: x
@@ -16,15 +16,17 @@
 # You should have received a copy of the GNU General Public License
 # along with FRED.  If not, see <https://www.gnu.org/licenses/>.
 
-from datetime import date
+from datetime import date, datetime, timedelta, timezone
+from threading import Thread
 from typing import cast
 from unittest import TestCase
+from unittest.mock import patch
 
 from dateutil.relativedelta import relativedelta
 from lxml.etree import Element, QName
 
 from epplib.tests.utils import EM
-from epplib.utils import ParseXMLMixin, safe_parse
+from epplib.utils import ParseXMLMixin, _get_parser, safe_iterparse, safe_parse
 
 
 class TestSafeParse(TestCase):
@@ -41,8 +43,85 @@ class TestSafeParse(TestCase):
         with self.assertRaisesRegex(ValueError, "Doctype is not allowed\\."):
             safe_parse(data)
 
+    def test_parse_comments(self):
+        data = b"""<?xml version="1.0" encoding="UTF-8"?>
+                   <simple xmlns="http://www.nic.cz/xml/epp"><!-- Comment --><item/></simple>"""
+        element = safe_parse(data)
+        self.assertEqual(
+            [item.tag for item in element], [QName("http://www.nic.cz/xml/epp", "item")]
+        )
+
+    def test_parser_per_thread(self):
+        parsers = []
+        thread = Thread(target=lambda: parsers.append(_get_parser()))
+        thread.start()
+        thread.join()
+        self.assertIs(_get_parser(), _get_parser())
+        self.assertIsNot(parsers[0], _get_parser())
+
+
+class TestSafeIterparse(TestCase):
+    def test_iterparse(self):
+        data = b"""<?xml version="1.0" encoding="UTF-8"?>
+                   <list xmlns="http://www.nic.cz/xml/epp">
+                       <item>first</item>
+                       <other>ignored</other>
+                       <item>second</item>
+                   </list>"""
+        tag = QName("http://www.nic.cz/xml/epp", "item").text
+        self.assertEqual(
+            [item.text for item in safe_iterparse(data, tag)], ["first", "second"]
+        )
+
+    def test_exception_on_doctype(self):
+        data = b"""<?xml version="1.0" encoding="UTF-8"?>
+                   <!DOCTYPE simple>
+                   <simple/>"""
+        with self.assertRaisesRegex(ValueError, "Doctype is not allowed\\."):
+            list(safe_iterparse(data, "simple"))
+
+    def test_exception_on_doctype_no_match(self):
+        data = b"""<?xml version="1.0" encoding="UTF-8"?>
+                   <!DOCTYPE simple>
+                   <simple/>"""
+        with self.assertRaisesRegex(ValueError, "Doctype is not allowed\\."):
+            list(safe_iterparse(data, "missing"))
+
+    def test_no_match(self):
+        data = b"""<?xml version="1.0" encoding="UTF-8"?>
+                   <simple/>"""
+        self.assertEqual(list(safe_iterparse(data, "missing")), [])
+
 
 class TestParseXMLMixin(TestCase):
+    def test_xpath(self):
+        xpath = ParseXMLMixin._xpath("./epp:lang")
+        self.assertIs(ParseXMLMixin._xpath("./epp:lang"), xpath)
+
+        class SameNamespaces(ParseXMLMixin):
+            pass
+
+        class OtherNamespaces(ParseXMLMixin):
+            _NAMESPACES = {"epp": "http://www.nic.cz/xml/epp"}
+
+        self.assertIs(SameNamespaces._xpath("./epp:lang"), xpath)
+        element = EM.svcMenu(EM.lang("en"))
+        self.assertEqual(OtherNamespaces._find(element, "./epp:lang"), None)
+
+    def test_xpath_namespaces_changed(self):
+        class ChangedNamespaces(ParseXMLMixin):
+            pass
+
+        element = EM.svcMenu(EM.lang("en"))
+        self.assertEqual(ChangedNamespaces._find_text(element, "./epp:lang"), "en")
+        with patch.object(
+            ChangedNamespaces, "_NAMESPACES", {"epp": "http://example.com/epp"}
+        ):
+            self.assertEqual(ChangedNamespaces._find(element, "./epp:lang"), None)
+        with patch.dict(ParseXMLMixin._NAMESPACES, {"epp": "http://example.com/epp"}):
+            self.assertEqual(ChangedNamespaces._find(element, "./epp:lang"), None)
+        self.assertEqual(ChangedNamespaces._find_text(element, "./epp:lang"), "en")
+
     def test_find(self):
         element = EM.svcMenu(EM.lang("en"), EM.lang("cs"))
         self.assertEqual(
@@ -91,6 +170,12 @@ class TestParseXMLMixin(TestCase):
             ParseXMLMixin._find_attrib(element, "./epp:other", "code"), None
         )
 
+    def test_find_attrib_first_element(self):
+        element = EM.response(EM.result(), EM.result(code="1000"))
+        self.assertEqual(
+            ParseXMLMixin._find_attrib(element, "./epp:result", "code"), None
+        )
+
     def test_find_child(self):
         element = EM.statement(EM.purpose(EM.admin()))
         self.assertEqual(ParseXMLMixin._find_child(element, "./epp:purpose"), "admin")
@@ -107,6 +192,50 @@ class TestParseXMLMixin(TestCase):
         self.assertEqual(ParseXMLMixin._optional(int, "1"), 1)
         self.assertEqual(ParseXMLMixin._optional(int, None), None)
 
+    def test_parse_datetime(self):
+        data = (
+            (
+                "2021-07-21T10:20:30Z",
+                datetime(2021, 7, 21, 10, 20, 30, tzinfo=timezone.utc),
+            ),
+            (
+                "2021-07-21T10:20:30.5+02:00",
+                datetime(
+                    2021, 7, 21, 10, 20, 30, 500000, tzinfo=timezone(timedelta(hours=2))
+                ),
+            ),
+            ("2021-07-21T10:20:30", datetime(2021, 7, 21, 10, 20, 30)),
+            # Not ISO 8601, parsed by dateutil.
+            ("21 Jul 2021 10:20:30", datetime(2021, 7, 21, 10, 20, 30)),
+        )
+        for value, expected in data:
+            with self.subTest(value=value):
+                self.assertEqual(ParseXMLMixin._parse_datetime(value), expected)
+
+    def test_parse_datetime_cached(self):
+        self.assertIs(
+            ParseXMLMixin._parse_datetime("2021-07-21T10:20:30Z"),
+            ParseXMLMixin._parse_datetime("2021-07-21T10:20:30Z"),
+        )
+
+    def test_parse_datetime_timezone(self):
+        data = (
+            ("2021-07-21T10:20:30Z", timezone.utc),
+            ("2021-07-21T10:20:30+02:00", timezone(timedelta(hours=2))),
+            # Not accepted by fromisoformat, parsed by dateutil.
+            ("Jul 21 2021 10:20:30 UTC", timezone.utc),
+            ("Jul 21 2021 10:20:30 +0200", timezone(timedelta(hours=2))),
+        )
+        for value, expected in data:
+            with self.subTest(value=value):
+                tzinfo = ParseXMLMixin._parse_datetime(value).tzinfo
+                self.assertIsInstance(tzinfo, timezone)
+                self.assertEqual(tzinfo, expected)
+
+    def test_parse_datetime_invalid(self):
+        with self.assertRaises(ValueError):
+            ParseXMLMixin._parse_datetime("invalid")
+
     def test_parse_date(self):
         self.assertEqual(ParseXMLMixin._parse_date("2021-07-21"), date(2021, 7, 21))
 
@@ -132,6 +261,11 @@ class TestParseXMLMixin(TestCase):
             with self.subTest(item=item):
                 self.assertEqual(ParseXMLMixin._parse_duration(item), expected)
 
+    def test_parse_duration_not_shared(self):
+        duration = ParseXMLMixin._parse_duration("P1D")
+        duration.days = 5
+        self.assertEqual(ParseXMLMixin._parse_duration("P1D"), relativedelta(days=1))
+
     def test_parse_duration_invalid(self):
         data = (
             "invalid",
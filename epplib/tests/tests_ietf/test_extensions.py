@@ -388,3 +388,13 @@ class TestDNSSECExtension(TestCase):
             keyData=[DNSSECKeyData(**keyDataDict), DNSSECKeyData(**keyDataDict2)]
         )
         self.assertEqual(result, expected)
+
+    def test_extract_unknown_child(self):
+        element = self.EM.infData(
+            self.EM.maxSigLife(str(paramsWithMultiDsData["maxSigLife"])),
+            self.EM.unknown("ignored"),
+        )
+
+        result = DNSSECExtension.extract(element)
+        expected = DNSSECExtension(maxSigLife=paramsWithMultiDsData["maxSigLife"])
+        self.assertEqual(result, expected)
@@ -158,14 +158,17 @@ class SocketTransport(Transport):
             header = self.socket.recv(self.HEADER_SIZE)
             expected_length = int.from_bytes(header, "big") - self.HEADER_SIZE
 
-            response = bytes()
+            # Grow the buffer as the chunks arrive. Extending a bytearray takes amortized linear
+            # time, unlike repeated concatenation of bytes. The buffer is not preallocated, since
+            # the length comes from the server and can not be trusted.
+            response = bytearray()
             while len(response) < expected_length:
                 response += self.socket.recv(
                     min(self.CHUNK_SIZE, expected_length - len(response))
                 )
 
             if response:
-                return response
+                return bytes(response)
 
             raise TransportError("Empty response recieved.")
 
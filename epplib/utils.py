@@ -19,17 +19,64 @@
 """Module providing various utility functions."""
 
 import re
-from datetime import date
-from typing import Callable, ClassVar, List, Mapping, Optional, Pattern, TypeVar, cast
+import sys
+import threading
+from datetime import date, datetime, timezone
+from functools import lru_cache
+from io import BytesIO
+from typing import Any, Callable, ClassVar, Dict, Iterator, List, Mapping, Optional, Pattern, Tuple, TypeVar, cast
 
 from dateutil.parser import parse as parse_datetime
 from dateutil.relativedelta import relativedelta
-from lxml.etree import Element, QName, XMLParser, fromstring
+from lxml.etree import Element, XMLParser, XPath, fromstring, iterparse
 
 from epplib.constants import NAMESPACE
 
 U = TypeVar("U")
 
+# Arguments of the dataclass decorator for the classes which are created in large
+# numbers. Slots are not supported by dataclasses before Python 3.10.
+# The slotted dataclass is a new class, so its methods have to name the class in
+# super(), the zero argument super() fails there.
+if sys.version_info >= (3, 10):
+    DATACLASS_SLOTS: Dict[str, Any] = {"slots": True}
+else:
+    DATACLASS_SLOTS: Dict[str, Any] = {}
+
+_BOOLEAN_VALUES = {"1": True, "true": True, "0": False, "false": False}
+
+_PARSERS = threading.local()
+
+
+def _get_parser() -> XMLParser:
+    """Return the XML parser of the current thread.
+
+    The parser is reused for all the parsed documents, but it can not be shared between
+    the threads. EPP responses do not use XML IDs, so they are not collected.
+    """
+    parser = getattr(_PARSERS, "parser", None)
+    if parser is None:
+        parser = XMLParser(
+            no_network=True,
+            resolve_entities=False,
+            remove_comments=True,
+            collect_ids=False,
+            huge_tree=False,
+        )
+        _PARSERS.parser = parser
+    return parser
+
+
+@lru_cache(maxsize=1024)
+def _parse_iso_datetime(value: str) -> datetime:
+    """Parse ISO 8601 datetime by datetime.fromisoformat.
+
+    Datetimes are immutable and the same values tend to repeat in the responses, so the results are cached.
+    """
+    if value.endswith("Z"):
+        return datetime.fromisoformat(value[:-1] + "+00:00")
+    return datetime.fromisoformat(value)
+
 
 def safe_parse(raw_xml: bytes) -> Element:
     """Wrap lxml.etree.fromstring function to make it safer against XML attacks.
@@ -40,9 +87,8 @@ def safe_parse(raw_xml: bytes) -> Element:
     Raises:
         ValueError: If the XML document contains doctype.
     """
-    parser = XMLParser(no_network=True, resolve_entities=False)
     parsed = fromstring(
-        raw_xml, parser=parser
+        raw_xml, parser=_get_parser()
     )  # nosec - It should be safe with resolve_entities=False.
 
     if parsed.getroottree().docinfo.doctype:
@@ -51,9 +97,47 @@ def safe_parse(raw_xml: bytes) -> Element:
     return parsed
 
 
+def safe_iterparse(raw_xml: bytes, tag: str) -> Iterator[Element]:
+    """Iterate over the elements with the tag as they are parsed from the raw XML.
+
+    The same protection against XML attacks as in safe_parse is used. The elements are
+    yielded once they are parsed completely, the rest of the document may not be
+    parsed yet.
+
+    Args:
+        raw_xml: The raw XML response which will be parsed.
+        tag: Tag of the elements to be yielded.
+
+    Raises:
+        ValueError: If the XML document contains doctype.
+    """
+    events = iterparse(
+        BytesIO(raw_xml),
+        events=("end",),
+        tag=tag,
+        no_network=True,
+        resolve_entities=False,
+        collect_ids=False,
+        huge_tree=False,
+    )  # nosec - It should be safe with resolve_entities=False.
+    checked = False
+    for _, element in events:
+        # The doctype precedes the root element, so it is known once the first element is parsed.
+        if not checked:
+            if element.getroottree().docinfo.doctype:
+                raise ValueError("Doctype is not allowed.")
+            checked = True
+        yield element
+    # Reject the doctype even if no element with the tag was found.
+    if not checked and events.root.getroottree().docinfo.doctype:
+        raise ValueError("Doctype is not allowed.")
+
+
 class ParseXMLMixin:
     """Mixin to simplify XML parsing."""
 
+    __slots__ = ()
+
     _NAMESPACES: ClassVar[Mapping[str, str]] = {
         "epp": NAMESPACE.EPP,
         "fred": NAMESPACE.FRED,
@@ -75,45 +159,65 @@ class ParseXMLMixin:
         re.ASCII,
     )
 
+    # Compiled XPath expressions by the id of the namespaces mapping they were compiled with. Every entry holds
+    # the mapping, so its id can not be reused, and a copy of it to detect the changes made in place.
+    _XPATHS: ClassVar[Dict[int, Tuple[Mapping[str, str], Dict[str, str], Dict[str, XPath]]]] = {}
+
+    @classmethod
+    def _xpath(cls, path: str) -> XPath:
+        """Return the XPath expression for the path compiled only once per namespaces."""
+        namespaces = cls._NAMESPACES
+        entry = cls._XPATHS.get(id(namespaces))
+        if entry is None or entry[1] != namespaces:
+            entry = (namespaces, dict(namespaces), {})
+            cls._XPATHS[id(namespaces)] = entry
+        xpaths = entry[2]
+        xpath = xpaths.get(path)
+        if xpath is None:
+            xpath = XPath(path, namespaces=namespaces, smart_strings=False)
+            xpaths[path] = xpath
+        return xpath
+
     @classmethod
     def _find(cls, element: Element, path: str) -> Optional[Element]:
-        return element.find(path, namespaces=cls._NAMESPACES)
+        found = cls._xpath(path)(element)
+        return found[0] if found else None
 
     @classmethod
     def _find_all(cls, element: Element, path: str) -> List[Element]:
-        return cast(List[Element], element.findall(path, namespaces=cls._NAMESPACES))
+        return cast(List[Element], cls._xpath(path)(element))
 
     @classmethod
     def _find_text(cls, element: Element, path: str) -> str:
-        return cast(str, element.findtext(path, namespaces=cls._NAMESPACES))
+        found = cls._xpath(path)(element)
+        return cast(str, (found[0].text or "") if found else None)
 
     @classmethod
     def _find_all_text(cls, element: Element, path: str) -> List[str]:
-        return [
-            (elem.text or "")
-            for elem in element.findall(path, namespaces=cls._NAMESPACES)
-        ]
+        return [(elem.text or "") for elem in cls._xpath(path)(element)]
 
     @classmethod
     def _find_attrib(cls, element: Element, path: str, attrib: str) -> Optional[str]:
-        found = element.find(path, namespaces=cls._NAMESPACES)
-        if found is not None:
-            return cast(Optional[str], found.attrib.get(attrib))
-        else:
-            return None
+        # Select the attribute of the first element directly, not the element itself.
+        found = cls._xpath("({})[1]/@{}".format(path, attrib))(element)
+        return cast(str, found[0]) if found else None
 
     @classmethod
     def _find_child(cls, element: Element, path: str) -> Optional[str]:
-        found_tags = cls._find_children(element, path)
-        if len(found_tags) > 0:
-            return found_tags[0]
+        # Let libxml2 return the local name of the first child only, without
+        # creating the element. Empty string means there is no child.
+        name = cls._xpath("local-name(({}/*)[1])".format(path))(element)
+        if name:
+            return sys.intern(name)
         else:
             return None
 
     @classmethod
     def _find_children(cls, element: Element, path: str) -> List[str]:
-        nodes = element.findall(path + "/*", namespaces=cls._NAMESPACES)
-        return [QName(item.tag).localname for item in nodes]
+        nodes = cls._find_all(element, path + "/*")
+        # Strip the namespace from the tag directly rather than through QName.
+        # Tag names are from a small fixed set, so they are interned.
+        return [sys.intern(item.tag.rpartition("}")[2]) for item in nodes]
 
     @staticmethod
     def _optional(function: Callable[[str], U], param: Optional[str]) -> Optional[U]:
@@ -124,8 +228,31 @@ class ParseXMLMixin:
             return function(param)
 
     @staticmethod
-    def _parse_date(value: str) -> date:
-        return parse_datetime(value).date()
+    def _parse_datetime(value: str) -> datetime:
+        """Parse datetime, the ISO 8601 format is tried first.
+
+        EPP uses ISO 8601 dates, which are parsed much faster by datetime.fromisoformat than by dateutil. Dateutil is
+        used for the values fromisoformat does not accept. Its results are not cached, because it fills the missing
+        fields from the current date. Time zones are always represented by datetime.timezone.
+
+        Args:
+            value: String to be parsed.
+
+        Raises:
+            ValueError: If the value can not be parsed.
+        """
+        try:
+            return _parse_iso_datetime(value)
+        except ValueError:
+            result = parse_datetime(value)
+        offset = result.utcoffset()
+        if offset is not None:
+            result = result.replace(tzinfo=timezone(offset))
+        return result
+
+    @classmethod
+    def _parse_date(cls, value: str) -> date:
+        return cls._parse_datetime(value).date()
 
     @classmethod
     def _parse_duration(cls, value: str) -> relativedelta:
@@ -140,6 +267,19 @@ class ParseXMLMixin:
         Raises:
             ValueError: If the value can not be parsed.
         """
+        sign, params = cls._parse_duration_params(value)
+        # Build a new relativedelta every time, the instance is mutable and must not be shared.
+        return sign * relativedelta(**dict(params))  # type: ignore
+
+    @classmethod
+    @lru_cache(maxsize=128)
+    def _parse_duration_params(
+        cls, value: str
+    ) -> Tuple[int, Tuple[Tuple[str, int], ...]]:
+        """Parse duration into the sign and the relativedelta params.
+
+        Servers tend to send the same durations, so the results are cached.
+        """
         value = value.strip()
         match = cls.duration_regex.fullmatch(value)
         if match:
@@ -154,7 +294,7 @@ class ParseXMLMixin:
             params["microseconds"] = (
                 int(10**6 * float(microseconds)) if microseconds is not None else 0
             )
-            return sign * relativedelta(**params)  # type: ignore
+            return sign, tuple(params.items())
         else:
             raise ValueError('Can not parse string "{}" as duration.'.format(value))
 
@@ -163,11 +303,9 @@ class ParseXMLMixin:
         """Convert str '0' or '1' to the corresponding bool value."""
         if value is None:
             return None
-        elif value.lower() in ("1", "true"):
-            return True
-        elif value.lower() in ("0", "false"):
-            return False
-        else:
+        try:
+            return _BOOLEAN_VALUES[value.lower()]
+        except KeyError:
             raise ValueError(
                 'Value "{}" is not in the list of known boolean values.'.format(value)
-            )
+            ) from None